@@ -4,33 +4,51 @@
 Web-based interface for efficient scanning of documents and photos using SANE.
 """
 
+import heapq
+import io
 import os
+import shutil
 import subprocess
 import tempfile
+import threading
+import time
+import types
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 from flask import Flask, render_template, request, jsonify, send_file, Response
+from werkzeug.wsgi import wrap_file
 from PIL import Image
 from pydantic import BaseModel, Field, field_validator
 import img2pdf
 
 app = Flask(__name__)
 app.config["SECRET_KEY"] = os.urandom(24)
+# Let a fronting web server (Apache mod_xsendfile, lighttpd) send preview files
+app.config["USE_X_SENDFILE"] = os.environ.get("BATCH_SCANNER_X_SENDFILE") == "1"
+
+
+# Accepted values for scan settings
+ALLOWED_FORMATS = frozenset({"jpeg", "jpg", "png", "tiff", "pdf"})
+ALLOWED_PAGE_SIZES = frozenset({"A4", "Letter", "Legal", "A3", "A5"})
 
 
 class ScanData(BaseModel):
     """Model for storing scan metadata.
 
     Attributes:
-        path: Filesystem path to the scanned image file.
-        timestamp: When the scan was created.
+        path: Filesystem path to the full-resolution scanned image file.
+        preview_path: Filesystem path to the downscaled preview image file.
+        timestamp: When the scan was created, in time.monotonic() seconds.
     """
 
     path: str = Field(..., description="Path to the scanned image file")
-    timestamp: datetime = Field(
-        default_factory=datetime.now, description="Scan creation timestamp"
+    preview_path: str = Field(..., description="Path to the preview image file")
+    timestamp: float = Field(
+        default_factory=time.monotonic, description="Scan creation timestamp"
     )
 
 
@@ -68,10 +86,10 @@ class ScanSettings(BaseModel):
         Raises:
             ValueError: If format is not supported.
         """
-        allowed = ["jpeg", "jpg", "png", "tiff", "pdf"]
-        if v.lower() not in allowed:
-            raise ValueError(f"Format must be one of {allowed}")
-        return "jpeg" if v.lower() == "jpg" else v.lower()
+        v = v.lower()
+        if v not in ALLOWED_FORMATS:
+            raise ValueError(f"Format must be one of {sorted(ALLOWED_FORMATS)}")
+        return "jpeg" if v == "jpg" else v
 
     @field_validator("page_size")
     def validate_page_size(cls, v: str) -> str:
@@ -86,9 +104,8 @@ class ScanSettings(BaseModel):
         Raises:
             ValueError: If page size is not supported.
         """
-        allowed = ["A4", "Letter", "Legal", "A3", "A5"]
-        if v not in allowed:
-            raise ValueError(f"Page size must be one of {allowed}")
+        if v not in ALLOWED_PAGE_SIZES:
+            raise ValueError(f"Page size must be one of {sorted(ALLOWED_PAGE_SIZES)}")
         return v
 
 
@@ -103,12 +120,30 @@ class SaveRequest(BaseModel):
     """
 
     scan_ids: List[str] = Field(
-        ..., min_items=1, description="List of scan IDs to save"
+        ..., min_length=1, description="List of scan IDs to save"
     )
     format: str = Field(default="jpeg", description="Output format")
     output_folder: str = Field(..., description="Output folder path")
     filename_prefix: str = Field(default="scan", description="Filename prefix")
 
+    @field_validator("format")
+    def validate_format(cls, v: str) -> str:
+        """Validate file format.
+
+        Args:
+            v: Format string to validate.
+
+        Returns:
+            Lowercased format string, also used as the file extension.
+
+        Raises:
+            ValueError: If format is not supported.
+        """
+        v = v.lower()
+        if v not in ALLOWED_FORMATS:
+            raise ValueError(f"Format must be one of {sorted(ALLOWED_FORMATS)}")
+        return v
+
 
 class DiscardRequest(BaseModel):
     """Model for discard request data.
@@ -122,12 +157,67 @@ class DiscardRequest(BaseModel):
     )
 
 
+# scanimage scan-area arguments (in mm) per page size, shared read-only
+PAGE_SIZE_ARGS: Mapping[str, Tuple[str, ...]] = types.MappingProxyType(
+    {
+        "A4": ("-x", "210", "-y", "297"),
+        "Letter": ("-x", "215.9", "-y", "279.4"),
+        "Legal": ("-x", "215.9", "-y", "355.6"),
+        "A3": ("-x", "297", "-y", "420"),
+        "A5": ("-x", "148", "-y", "210"),
+    }
+)
+
+# Image formats keyed by file extension, used to detect same-format saves
+IMAGE_FORMATS_BY_EXTENSION: Dict[str, str] = {
+    "jpg": "jpeg",
+    "jpeg": "jpeg",
+    "png": "png",
+    "tif": "tiff",
+    "tiff": "tiff",
+}
+
+# Longest side, in pixels, of the JPEG previews shown in the browser
+PREVIEW_MAX_DIM = 1600
+
+# Read size used when streaming preview files to the client
+PREVIEW_CHUNK_SIZE = 64 * 1024
+
+# Seconds a scan is kept before it is cleaned up
+SCAN_MAX_AGE = 3600  # 1 hour
+
 # Session storage - stores temporary scans by ID
 scan_storage: Dict[str, ScanData] = {}
 
+# Min-heap of (monotonic expiry time, scan ID) so cleanup only touches expired scans
+scan_expiry_heap: List[Tuple[float, str]] = []
+
+# Guards scan_storage and scan_expiry_heap across request threads
+scan_storage_lock = threading.Lock()
+
 # Default settings
 default_settings = ScanSettings()
 
+# Background save jobs, so /api/save returns before the files are written
+save_executor = ThreadPoolExecutor(max_workers=4)
+
+# Running save jobs by job ID
+save_jobs: Dict[str, Future] = {}
+
+# Finished save jobs as (monotonic finish time, saved path, error message),
+# kept for SCAN_MAX_AGE seconds so clients can fetch the result
+save_results: Dict[str, Tuple[float, Optional[str], Optional[str]]] = {}
+
+# Guards save_jobs and save_results across request and worker threads
+save_jobs_lock = threading.Lock()
+
+# Seconds a scanimage -L result is reused before scanners are enumerated again
+DEVICES_CACHE_TTL = 60
+
+# Cached scanner device listing as (monotonic time fetched, scanimage output)
+devices_cache: Tuple[float, str] = (0.0, "")
+devices_cache_lock = threading.Lock()
+
 
 def ensure_output_folder(folder_path: str) -> None:
     """Create output folder if it doesn't exist.
@@ -138,9 +228,16 @@ def ensure_output_folder(folder_path: str) -> None:
     Path(folder_path).mkdir(parents=True, exist_ok=True)
 
 
-def get_scanner_devices() -> str:
+def get_scanner_devices(force: bool = False) -> str:
     """Get list of available SANE scanner devices.
 
+    Enumerating scanners is slow, so a successful listing is cached for
+    DEVICES_CACHE_TTL seconds.
+
+    Args:
+        force: Ignore the cached listing and query scanimage again.
+            Defaults to False.
+
     Returns:
         String containing scanner device information or error message.
 
@@ -149,60 +246,67 @@ def get_scanner_devices() -> str:
         >>> 'device' in devices
         True
     """
-    try:
-        result = subprocess.run(
-            ["scanimage", "-L"], capture_output=True, text=True, timeout=10
-        )
+    global devices_cache
+
+    with devices_cache_lock:
+        fetched_at, devices = devices_cache
+        is_fresh = fetched_at and time.monotonic() - fetched_at < DEVICES_CACHE_TTL
+        if is_fresh and not force:
+            return devices
+
+        try:
+            result = subprocess.run(
+                ["scanimage", "-L"], capture_output=True, text=True, timeout=10
+            )
+        except Exception as e:
+            return f"Error detecting scanners: {str(e)}"
+
+        devices_cache = (time.monotonic(), result.stdout)
         return result.stdout
-    except Exception as e:
-        return f"Error detecting scanners: {str(e)}"
 
 
-def get_page_size_args(page_size: str) -> List[str]:
+def get_page_size_args(page_size: str) -> Tuple[str, ...]:
     """Get scanimage page size arguments.
 
     Args:
         page_size: Page size identifier (A4, Letter, Legal, A3, A5).
 
     Returns:
-        List of command-line arguments for scanimage, or empty list if unknown.
+        Tuple of command-line arguments for scanimage, or empty tuple if unknown.
 
     Examples:
         >>> get_page_size_args('A4')
-        ['-x', '210', '-y', '297']
+        ('-x', '210', '-y', '297')
         >>> get_page_size_args('Unknown')
-        []
-    """
-    sizes: Dict[str, List[str]] = {
-        "A4": ["-x", "210", "-y", "297"],
-        "Letter": ["-x", "215.9", "-y", "279.4"],
-        "Legal": ["-x", "215.9", "-y", "355.6"],
-        "A3": ["-x", "297", "-y", "420"],
-        "A5": ["-x", "148", "-y", "210"],
-    }
-    return sizes.get(page_size, [])
+        ()
+    """
+    return PAGE_SIZE_ARGS.get(page_size, ())
 
 
 def scan_image(resolution: int = 300, page_size: str = "A4") -> str:
     """Scan an image using scanimage command.
 
+    scanimage encodes the JPEG itself while the page is scanned, so the raw
+    image is never decoded or held in memory by this process.
+
     Args:
         resolution: Scan resolution in DPI. Defaults to 300.
         page_size: Page size identifier. Defaults to 'A4'.
 
     Returns:
-        Path to the temporary scanned image file (PNM format).
+        Path to the temporary scanned image file (JPEG format).
 
     Raises:
         Exception: If scanning fails or scanner is not available.
 
     Examples:
         >>> path = scan_image(300, 'A4')
-        >>> os.path.exists(path)
+        >>> path.endswith('.jpeg')
         True
     """
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pnm")
-    temp_file.close()
+    # scanimage opens the output by path, so only the reserved name is needed
+    fd, temp_path = tempfile.mkstemp(suffix=".jpeg")
+    os.close(fd)
 
     try:
         # Use scanimage to scan
@@ -211,34 +315,36 @@ def scan_image(resolution: int = 300, page_size: str = "A4") -> str:
             "--resolution",
             str(resolution),
             "--format",
-            "pnm",
+            "jpeg",
             "--output",
-            temp_file.name,
+            temp_path,
         ]
 
         # Add page size if specified
-        size_args = get_page_size_args(page_size)
-        if size_args:
-            cmd.extend(size_args)
+        cmd.extend(get_page_size_args(page_size))
 
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
 
         if result.returncode != 0:
             raise Exception(f"Scan failed: {result.stderr}")
 
-        return temp_file.name
+        return temp_path
     except Exception as e:
-        if os.path.exists(temp_file.name):
-            os.remove(temp_file.name)
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
         raise e
 
 
-def convert_image(input_path: str, output_format: str = "jpeg") -> str:
+def convert_image(
+    input_path: str, output_format: str = "jpeg", max_dim: Optional[int] = None
+) -> str:
     """Convert image to desired format.
 
     Args:
         input_path: Path to the input image file.
         output_format: Desired output format (jpeg, png, tiff). Defaults to 'jpeg'.
+        max_dim: If set, downscale the image so neither side exceeds this many
+            pixels. Defaults to None (keep full resolution).
 
     Returns:
         Path to the converted temporary image file.
@@ -247,27 +353,45 @@ def convert_image(input_path: str, output_format: str = "jpeg") -> str:
         Exception: If image conversion fails.
 
     Examples:
-        >>> path = convert_image('/tmp/scan.pnm', 'jpeg')
-        >>> path.endswith('.jpeg')
+        >>> path = convert_image('/tmp/scan.jpeg', 'png')
+        >>> path.endswith('.png')
+        True
+        >>> preview = convert_image('/tmp/scan.jpeg', 'jpeg', max_dim=1600)
+        >>> max(Image.open(preview).size) <= 1600
         True
     """
     # Normalize format
     if output_format.lower() == "jpg":
         output_format = "jpeg"
 
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f".{output_format}")
-    temp_file.close()
-
     img = Image.open(input_path)
 
+    # Downscale before any other processing so only the small image is handled.
+    # For JPEG input, draft() makes libjpeg scale down while decoding, so the
+    # full-resolution raster is never allocated.
+    if max_dim is not None:
+        img.draft("RGB", (max_dim, max_dim))
+        img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+
     # Convert to RGB if needed (for JPEG)
     if output_format.lower() == "jpeg" and img.mode in ["RGBA", "LA", "P"]:
         img = img.convert("RGB")
 
-    img.save(temp_file.name, format=output_format.upper())
-    img.close()
+    save_options = {}
+    if output_format.lower() == "jpeg":
+        save_options = {"quality": 82, "optimize": True, "progressive": True}
+
+    fd, temp_path = tempfile.mkstemp(suffix=f".{output_format}")
+    try:
+        with os.fdopen(fd, "wb", buffering=1 << 20) as f:
+            img.save(f, format=output_format.upper(), **save_options)
+    except Exception as e:
+        os.remove(temp_path)
+        raise e
+    finally:
+        img.close()
 
-    return temp_file.name
+    return temp_path
 
 
 def trim_bottom_whitespace(image_path: str) -> str:
@@ -332,42 +456,60 @@ def trim_bottom_whitespace(image_path: str) -> str:
     return image_path
 
 
+def safe_unlink(path: str) -> None:
+    """Delete a file, ignoring it if it is already gone.
+
+    Args:
+        path: Path to the file to delete.
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
 def cleanup_old_scans() -> None:
     """Clean up scans older than 1 hour.
 
-    Iterates through scan_storage and removes scans that are older than 3600 seconds,
-    deleting both the storage entry and the associated file.
+    Pops expired entries off scan_expiry_heap, deleting both the storage entry
+    and the associated file. Entries for scans that were already saved or
+    discarded are skipped.
     """
-    now = datetime.now()
-    to_delete: List[str] = []
+    now = time.monotonic()
+    expired: List[ScanData] = []
 
-    for scan_id, scan_data in scan_storage.items():
-        age = (now - scan_data.timestamp).total_seconds()
-        if age > 3600:  # 1 hour
-            to_delete.append(scan_id)
+    with scan_storage_lock:
+        while scan_expiry_heap and scan_expiry_heap[0][0] <= now:
+            _, scan_id = heapq.heappop(scan_expiry_heap)
+            scan_data = scan_storage.pop(scan_id, None)
+            if scan_data is not None:
+                expired.append(scan_data)
 
-    for scan_id in to_delete:
-        scan_data = scan_storage.pop(scan_id)
-        if os.path.exists(scan_data.path):
-            os.remove(scan_data.path)
+    for scan_data in expired:
+        safe_unlink(scan_data.path)
+        safe_unlink(scan_data.preview_path)
 
 
-def store_scan(image_path: str) -> str:
+def store_scan(image_path: str, preview_path: str) -> str:
     """Store a scan with a unique ID.
 
     Args:
-        image_path: Filesystem path to the scanned image.
+        image_path: Filesystem path to the full-resolution scanned image.
+        preview_path: Filesystem path to the downscaled preview image.
 
     Returns:
         Unique scan ID (UUID) for retrieving the scan later.
 
     Examples:
-        >>> scan_id = store_scan('/tmp/scan.jpg')
+        >>> scan_id = store_scan('/tmp/scan.jpg', '/tmp/preview.jpg')
         >>> len(scan_id) == 36  # UUID length
         True
     """
     scan_id = str(uuid.uuid4())
-    scan_storage[scan_id] = ScanData(path=image_path)
+    with scan_storage_lock:
+        scan_data = ScanData(path=image_path, preview_path=preview_path)
+        scan_storage[scan_id] = scan_data
+        heapq.heappush(scan_expiry_heap, (scan_data.timestamp + SCAN_MAX_AGE, scan_id))
     cleanup_old_scans()
     return scan_id
 
@@ -386,8 +528,31 @@ def get_scan_path(scan_id: str) -> Optional[str]:
         >>> path is None
         True
     """
-    if scan_id in scan_storage:
-        return scan_storage[scan_id].path
+    with scan_storage_lock:
+        scan_data = scan_storage.get(scan_id)
+    if scan_data is not None:
+        return scan_data.path
+    return None
+
+
+def get_preview_path(scan_id: str) -> Optional[str]:
+    """Get the preview file path for a scan ID.
+
+    Args:
+        scan_id: Unique scan identifier.
+
+    Returns:
+        Filesystem path to the scan preview, or None if not found.
+
+    Examples:
+        >>> path = get_preview_path('invalid-id')
+        >>> path is None
+        True
+    """
+    with scan_storage_lock:
+        scan_data = scan_storage.get(scan_id)
+    if scan_data is not None:
+        return scan_data.preview_path
     return None
 
 
@@ -405,12 +570,114 @@ def delete_scan(scan_id: str) -> bool:
         >>> success
         False
     """
-    if scan_id in scan_storage:
-        scan_data = scan_storage.pop(scan_id)
-        if os.path.exists(scan_data.path):
-            os.remove(scan_data.path)
-        return True
-    return False
+    return delete_scans_batch([scan_id]) == 1
+
+
+def delete_scans_batch(scan_ids: List[str]) -> int:
+    """Delete several scans by ID.
+
+    All storage entries are removed under a single lock acquisition before
+    their files are unlinked.
+
+    Args:
+        scan_ids: Unique scan identifiers to delete.
+
+    Returns:
+        Number of scans that were found and deleted.
+
+    Examples:
+        >>> delete_scans_batch(['invalid-id-1', 'invalid-id-2'])
+        0
+    """
+    deleted: List[ScanData] = []
+    with scan_storage_lock:
+        for scan_id in scan_ids:
+            scan_data = scan_storage.pop(scan_id, None)
+            if scan_data is not None:
+                deleted.append(scan_data)
+
+    for scan_data in deleted:
+        safe_unlink(scan_data.path)
+        safe_unlink(scan_data.preview_path)
+
+    return len(deleted)
+
+
+def create_output_file(
+    output_folder: str, filename_prefix: str, extension: str
+) -> Tuple[str, int]:
+    """Atomically create a new, uniquely named output file.
+
+    Files are named {prefix}_{timestamp}_{id}.{extension}, where id is a short
+    random hex string. The name is claimed with O_CREAT | O_EXCL, so concurrent
+    saves can never pick the same file; a new id is drawn on the rare clash.
+
+    Args:
+        output_folder: Folder to create the file in.
+        filename_prefix: Prefix for the filename.
+        extension: File extension without the leading dot.
+
+    Returns:
+        Tuple of the full path and an open, write-only file descriptor.
+
+    Examples:
+        >>> path, fd = create_output_file('/tmp/output', 'scan', 'pdf')
+        >>> os.close(fd)
+        >>> path.endswith('.pdf')
+        True
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    while True:
+        file_id = uuid.uuid4().hex[:6]
+        filename = f"{filename_prefix}_{timestamp}_{file_id}.{extension}"
+        output_path = os.path.join(output_folder, filename)
+        try:
+            fd = os.open(output_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        except FileExistsError:
+            continue
+        return output_path, fd
+
+
+def copy_file_to_fd(source_path: str, dest_fd: int) -> None:
+    """Copy a file's contents into an open file descriptor.
+
+    Uses os.sendfile so the data is copied inside the kernel, falling back to
+    a buffered copy where sendfile is unavailable or unsupported for files.
+
+    Args:
+        source_path: Path to the file to copy.
+        dest_fd: Writable file descriptor to copy into. It is left open.
+
+    Raises:
+        OSError: If reading or writing fails, or the source ends before all
+            of its bytes have been copied.
+    """
+    with open(source_path, "rb") as src:
+        if hasattr(os, "sendfile"):
+            size = os.fstat(src.fileno()).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(dest_fd, src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # Only fall back if nothing was written yet, e.g. on platforms
+                # where sendfile requires a socket destination
+                if offset:
+                    raise
+            else:
+                # The source ended early, e.g. it was truncated mid-copy
+                if offset < size:
+                    raise OSError(
+                        f"Short copy of {source_path}: {offset} of {size} bytes"
+                    )
+                return
+
+        with os.fdopen(dest_fd, "wb", closefd=False) as dst:
+            shutil.copyfileobj(src, dst)
 
 
 def save_single_image(
@@ -418,6 +685,9 @@ def save_single_image(
 ) -> str:
     """Save a single image file to disk.
 
+    If the source image is already in the requested format, its bytes are
+    copied as-is instead of being decoded and re-encoded.
+
     Args:
         image_path: Path to the source image file.
         output_folder: Destination folder for the saved image.
@@ -437,24 +707,80 @@ def save_single_image(
     """
     ensure_output_folder(output_folder)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    counter = 1
+    output_path, fd = create_output_file(output_folder, filename_prefix, file_format)
 
-    while True:
-        filename = f"{filename_prefix}_{timestamp}_{counter:03d}.{file_format}"
-        output_path = os.path.join(output_folder, filename)
-        if not os.path.exists(output_path):
-            break
-        counter += 1
+    source_ext = os.path.splitext(image_path)[1].lstrip(".").lower()
+    source_format = IMAGE_FORMATS_BY_EXTENSION.get(source_ext)
+    target_format = IMAGE_FORMATS_BY_EXTENSION.get(file_format.lower())
 
-    # Copy the image to the final destination
-    img = Image.open(image_path)
-    img.save(output_path)
-    img.close()
+    try:
+        if source_format is not None and source_format == target_format:
+            # Same format - copy the bytes into the reserved file. Never hard
+            # link: scan temp files are 0600 and the link would share their inode
+            try:
+                copy_file_to_fd(image_path, fd)
+            finally:
+                os.close(fd)
+            return output_path
+
+        # Re-encode the image to the requested format
+        with os.fdopen(fd, "wb") as f:
+            img = Image.open(image_path)
+            if target_format == "jpeg":
+                if img.mode in ["RGBA", "LA", "P"]:
+                    img = img.convert("RGB")
+                img.save(f, format="JPEG", quality=85, optimize=True)
+            else:
+                img.save(f, format=(target_format or file_format).upper())
+        img.close()
+    except Exception as e:
+        safe_unlink(output_path)
+        raise e
 
     return output_path
 
 
+def read_file_bytes(path: str) -> bytes:
+    """Read the full contents of a file.
+
+    Args:
+        path: Path to the file to read.
+
+    Returns:
+        File contents as bytes.
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def load_pdf_page(image_path: str) -> bytes:
+    """Load an image as JPEG data for embedding in a PDF.
+
+    JPEG files are returned as-is, since img2pdf embeds JPEG data without
+    decoding it. Other formats are converted to JPEG in memory.
+
+    Args:
+        image_path: Path to the page image file.
+
+    Returns:
+        JPEG-encoded page data.
+
+    Examples:
+        >>> load_pdf_page('/tmp/page1.jpg')[:2]
+        b'\\xff\\xd8'
+    """
+    ext = os.path.splitext(image_path)[1].lstrip(".").lower()
+    if IMAGE_FORMATS_BY_EXTENSION.get(ext) == "jpeg":
+        return read_file_bytes(image_path)
+
+    buffer = io.BytesIO()
+    with Image.open(image_path) as img:
+        if img.mode not in ["RGB", "L", "CMYK"]:
+            img = img.convert("RGB")
+        img.save(buffer, format="JPEG", quality=85, optimize=True)
+    return buffer.getvalue()
+
+
 def save_pdf(image_paths: List[str], output_folder: str, filename_prefix: str) -> str:
     """Save multiple images as a single PDF file.
 
@@ -477,23 +803,111 @@ def save_pdf(image_paths: List[str], output_folder: str, filename_prefix: str) -
     """
     ensure_output_folder(output_folder)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    counter = 1
+    # Load all pages concurrently (converting any non-JPEG pages), then wrap the
+    # buffered JPEG data into a PDF before an output name is reserved
+    with ThreadPoolExecutor(max_workers=min(8, len(image_paths))) as executor:
+        page_data = list(executor.map(load_pdf_page, image_paths))
+    pdf_data = img2pdf.convert(page_data)
 
-    while True:
-        filename = f"{filename_prefix}_{timestamp}_{counter:03d}.pdf"
-        output_path = os.path.join(output_folder, filename)
-        if not os.path.exists(output_path):
-            break
-        counter += 1
+    output_path, fd = create_output_file(output_folder, filename_prefix, "pdf")
 
-    # Convert all images to PDF
-    with open(output_path, "wb") as f:
-        f.write(img2pdf.convert(image_paths))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf_data)
+    except Exception as e:
+        safe_unlink(output_path)
+        raise e
 
     return output_path
 
 
+def save_scans(image_paths: List[str], save_request: SaveRequest) -> str:
+    """Save scans to disk and remove them from storage.
+
+    Args:
+        image_paths: Paths of the scanned images, in page order.
+        save_request: Validated save request.
+
+    Returns:
+        Full path to the saved file.
+
+    Raises:
+        Exception: If saving fails. The scans are kept in that case.
+
+    Examples:
+        >>> request_data = SaveRequest(scan_ids=['id1'], output_folder='/tmp/out')
+        >>> path = save_scans(['/tmp/scan.jpeg'], request_data)
+        >>> path.endswith('.jpeg')
+        True
+    """
+    # Save based on format
+    if save_request.format == "pdf":
+        # Single or multi-page PDF
+        saved_path = save_pdf(
+            image_paths, save_request.output_folder, save_request.filename_prefix
+        )
+    else:
+        # Single image file
+        saved_path = save_single_image(
+            image_paths[0],
+            save_request.output_folder,
+            save_request.filename_prefix,
+            save_request.format,
+        )
+
+    # Clean up saved scans
+    delete_scans_batch(save_request.scan_ids)
+
+    return saved_path
+
+
+def finish_save_job(job_id: str, job: Future) -> None:
+    """Record the outcome of a finished save job.
+
+    Only the saved path or error message is kept, so a failed job does not
+    hold on to its exception and the page data referenced by its traceback.
+
+    Args:
+        job_id: Save job identifier.
+        job: The finished save job.
+    """
+    saved_path: Optional[str] = None
+    error: Optional[str] = None
+    try:
+        saved_path = job.result()
+    except Exception as e:
+        error = str(e)
+
+    with save_jobs_lock:
+        save_jobs.pop(job_id, None)
+        save_results[job_id] = (time.monotonic(), saved_path, error)
+
+
+def cleanup_old_save_results() -> None:
+    """Forget finished save jobs older than SCAN_MAX_AGE seconds."""
+    cutoff = time.monotonic() - SCAN_MAX_AGE
+    with save_jobs_lock:
+        expired = [
+            job_id
+            for job_id, (finished_at, _, _) in save_results.items()
+            if finished_at <= cutoff
+        ]
+        for job_id in expired:
+            del save_results[job_id]
+
+
+def warm_up_image_codecs() -> None:
+    """Load image codecs and img2pdf before the first request.
+
+    Pillow registers most of its format plugins lazily, so without this the
+    first scan or save pays for importing them.
+    """
+    Image.init()
+    buffer = io.BytesIO()
+    Image.new("RGB", (16, 16)).save(buffer, format="JPEG")
+    img2pdf.convert(buffer.getvalue())
+
+
 @app.route("/")
 def index() -> str:
     """Render the main application page.
@@ -530,22 +944,18 @@ def scan() -> Tuple[Response, int]:
     auto_trim = bool(data.get("auto_trim", False))
 
     try:
-        # Perform the scan
-        scanned_pnm = scan_image(resolution, page_size)
-
-        # Convert to JPEG for preview
-        preview_format = "jpeg"
-        converted_image = convert_image(scanned_pnm, preview_format)
-
-        # Remove the PNM file
-        os.remove(scanned_pnm)
+        # Perform the scan, straight to a full-resolution JPEG kept for saving
+        scanned_image = scan_image(resolution, page_size)
 
         # Apply auto-trim if enabled
         if auto_trim:
-            trim_bottom_whitespace(converted_image)
+            trim_bottom_whitespace(scanned_image)
+
+        # Create a downscaled JPEG for preview
+        preview_image = convert_image(scanned_image, "jpeg", max_dim=PREVIEW_MAX_DIM)
 
         # Store scan with unique ID
-        scan_id = store_scan(converted_image)
+        scan_id = store_scan(scanned_image, preview_image)
 
         return jsonify(
             {
@@ -563,6 +973,10 @@ def scan() -> Tuple[Response, int]:
 def preview(scan_id: str) -> Tuple[Response, int]:
     """Get scan preview image by ID.
 
+    Previews are served as conditional responses, so browsers revalidating a
+    cached preview get a 304 without the image being sent again. The file is
+    streamed in PREVIEW_CHUNK_SIZE chunks unless X-Sendfile is enabled.
+
     Args:
         scan_id: Unique scan identifier from URL path.
 
@@ -573,25 +987,60 @@ def preview(scan_id: str) -> Tuple[Response, int]:
         >>> # GET /api/preview/abc-123-def
         >>> # Returns: JPEG image or 404 error
     """
-    image_path = get_scan_path(scan_id)
-    if image_path and os.path.exists(image_path):
-        return send_file(image_path, mimetype="image/jpeg"), 200
-    else:
+    image_path = get_preview_path(scan_id)
+    if not image_path or not os.path.exists(image_path):
         return jsonify({"error": "Preview not found"}), 404
 
+    if app.config["USE_X_SENDFILE"]:
+        response = send_file(
+            image_path,
+            mimetype="image/jpeg",
+            conditional=True,
+            etag=True,
+            max_age=SCAN_MAX_AGE,
+        )
+    else:
+        f = open(image_path, "rb")
+        stat = os.fstat(f.fileno())
+        # Ask the kernel to start reading the whole file ahead of the stream
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        response = Response(
+            wrap_file(request.environ, f, PREVIEW_CHUNK_SIZE),
+            mimetype="image/jpeg",
+            direct_passthrough=True,
+        )
+        response.call_on_close(f.close)
+        response.content_length = stat.st_size
+        response.last_modified = stat.st_mtime
+        response.set_etag(f"{stat.st_mtime}-{stat.st_size}")
+        response.cache_control.max_age = SCAN_MAX_AGE
+        response.make_conditional(
+            request.environ, accept_ranges=True, complete_length=stat.st_size
+        )
+
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response, response.status_code
+
 
 @app.route("/api/scanner_info")
 def scanner_info() -> Tuple[Response, int]:
     """Get information about available scanners.
 
+    Accepts an optional ``force=1`` query parameter to bypass the cached
+    device listing and rescan for devices.
+
     Returns:
         JSON response containing scanner device information.
 
     Examples:
-        >>> # GET /api/scanner_info
+        >>> # GET /api/scanner_info?force=1
         >>> # Returns: {"devices": "device `...` is a ..."}
     """
-    devices = get_scanner_devices()
+    force = request.args.get("force") == "1"
+    devices = get_scanner_devices(force=force)
     return jsonify({"devices": devices}), 200
 
 
@@ -599,6 +1048,9 @@ def scanner_info() -> Tuple[Response, int]:
 def save() -> Tuple[Response, int]:
     """Save scans to disk.
 
+    The save runs as a background job; poll the returned status URL for the
+    result. Pass the ``sync=1`` query parameter to wait for the save instead.
+
     Expects JSON request body with:
         - scan_ids (list[str]): List of scan IDs to save
         - format (str): Output format (jpeg, png, tiff, pdf)
@@ -606,7 +1058,11 @@ def save() -> Tuple[Response, int]:
         - filename_prefix (str): Filename prefix
 
     Returns:
-        JSON response containing:
+        JSON response with 202 status code containing:
+            - success (bool): Whether the save job was started
+            - job_id (str): Unique identifier for the save job
+            - status_url (str): URL to poll for the save result
+        With ``sync=1``, JSON response containing:
             - success (bool): Whether save succeeded
             - saved_path (str): Full path to saved file
             - filename (str): Name of saved file
@@ -614,43 +1070,28 @@ def save() -> Tuple[Response, int]:
 
     Examples:
         >>> # POST /api/save with SaveRequest data
-        >>> # Returns: {"success": true, "saved_path": "...", "filename": "..."}
+        >>> # Returns: {"success": true, "job_id": "...", "status_url": "..."}
     """
     try:
-        data = request.json
-        save_request = SaveRequest(**data)
+        save_request = SaveRequest.model_validate_json(request.get_data())
     except Exception as e:
         return jsonify({"success": False, "error": f"Invalid request: {str(e)}"}), 400
 
-    try:
-        # Get all scan paths
-        image_paths: List[str] = []
-        for scan_id in save_request.scan_ids:
-            path = get_scan_path(scan_id)
-            if path:
-                image_paths.append(path)
-
-        if not image_paths:
-            return jsonify({"success": False, "error": "No valid scans found"}), 400
-
-        # Save based on format
-        if save_request.format == "pdf":
-            # Single or multi-page PDF
-            saved_path = save_pdf(
-                image_paths, save_request.output_folder, save_request.filename_prefix
-            )
-        else:
-            # Single image file
-            saved_path = save_single_image(
-                image_paths[0],
-                save_request.output_folder,
-                save_request.filename_prefix,
-                save_request.format,
-            )
+    # Get all scan paths
+    image_paths: List[str] = []
+    for scan_id in save_request.scan_ids:
+        path = get_scan_path(scan_id)
+        if path:
+            image_paths.append(path)
+
+    if not image_paths:
+        return jsonify({"success": False, "error": "No valid scans found"}), 400
 
-        # Clean up saved scans
-        for scan_id in save_request.scan_ids:
-            delete_scan(scan_id)
+    if request.args.get("sync") == "1":
+        try:
+            saved_path = save_scans(image_paths, save_request)
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)}), 500
 
         return jsonify(
             {
@@ -660,8 +1101,67 @@ def save() -> Tuple[Response, int]:
             }
         ), 200
 
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    cleanup_old_save_results()
+
+    job_id = uuid.uuid4().hex
+    job = save_executor.submit(save_scans, image_paths, save_request)
+    with save_jobs_lock:
+        save_jobs[job_id] = job
+    # Registered outside the lock: it runs right away if the job already ended
+    job.add_done_callback(partial(finish_save_job, job_id))
+
+    return jsonify(
+        {
+            "success": True,
+            "job_id": job_id,
+            "status_url": f"/api/save_status/{job_id}",
+        }
+    ), 202
+
+
+@app.route("/api/save_status/<job_id>")
+def save_status(job_id: str) -> Tuple[Response, int]:
+    """Get the result of a background save job.
+
+    Finished jobs can be queried until they are older than SCAN_MAX_AGE.
+
+    Args:
+        job_id: Save job identifier returned by /api/save.
+
+    Returns:
+        JSON response containing:
+            - success (bool): Whether the save succeeded (or is still running)
+            - done (bool): Whether the save job has finished
+            - saved_path (str): Full path to saved file, once done
+            - filename (str): Name of saved file, once done
+        Or error response with 404/500 status code.
+
+    Examples:
+        >>> # GET /api/save_status/0123abcd...
+        >>> # Returns: {"success": true, "done": true, "saved_path": "...", ...}
+    """
+    with save_jobs_lock:
+        is_running = job_id in save_jobs
+        result = save_results.get(job_id)
+
+    if is_running:
+        return jsonify({"success": True, "done": False}), 200
+
+    if result is None:
+        return jsonify({"success": False, "error": "Save job not found"}), 404
+
+    _, saved_path, error = result
+    if error is not None:
+        return jsonify({"success": False, "done": True, "error": error}), 500
+
+    return jsonify(
+        {
+            "success": True,
+            "done": True,
+            "saved_path": saved_path,
+            "filename": os.path.basename(saved_path),
+        }
+    ), 200
 
 
 @app.route("/api/discard", methods=["POST"])
@@ -681,19 +1181,19 @@ def discard() -> Tuple[Response, int]:
         >>> # Returns: {"success": true, "deleted_count": 2}
     """
     try:
-        data = request.json
-        discard_request = DiscardRequest(**data)
+        discard_request = DiscardRequest.model_validate_json(request.get_data())
     except Exception as e:
         return jsonify({"success": False, "error": f"Invalid request: {str(e)}"}), 400
 
-    deleted_count = 0
-    for scan_id in discard_request.scan_ids:
-        if delete_scan(scan_id):
-            deleted_count += 1
+    deleted_count = delete_scans_batch(discard_request.scan_ids)
 
     return jsonify({"success": True, "deleted_count": deleted_count}), 200
 
 
+# Runs on import, so every worker process is warmed up, not just app.run
+warm_up_image_codecs()
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Batch Scanner Application")
@@ -173,7 +173,12 @@ async function saveCurrent() {
             body: JSON.stringify(settings)
         });
         
-        const data = await response.json();
+        let data = await response.json();
+        
+        // Saves run in the background - wait for the job to finish
+        if (response.status === 202) {
+            data = await waitForSaveJob(data.status_url);
+        }
         
         if (data.success) {
             showStatus(`Saved: ${data.filename}`, 'success');
@@ -197,6 +202,20 @@ async function saveCurrent() {
     }
 }
 
+// Poll a background save job until it has finished
+async function waitForSaveJob(statusUrl) {
+    while (true) {
+        const response = await fetch(statusUrl);
+        const data = await response.json();
+        
+        if (!data.success || data.done) {
+            return data;
+        }
+        
+        await new Promise(resolve => setTimeout(resolve, 250));
+    }
+}
+
 // Discard all scans
 async function discardAll() {
     if (isScanning || scanIds.length === 0) return;